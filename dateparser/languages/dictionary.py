@@ -19,6 +19,10 @@ KNOWN_WORD_TOKENS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday',
 PARENTHESES_PATTERN = re.compile(r'[\(\)]')
 NUMERAL_PATTERN = re.compile(r'(\d+)')
 KEEP_TOKEN_PATTERN = re.compile(r"^.*[^\W_].*$", flags=re.U)
+WORD_BOUNDARY_CHAR_PATTERN = re.compile(r"[\W_\d]", flags=re.U)
+TRIE_WORD_END = ''
+CHARACTER_CLASS_PATTERN = re.compile(r"(?<!\\)\[[^^\]][^\]]*\]")
+SIMPLE_RELATIVE_STRING_PATTERN = re.compile(r"^(?:\\[ds\W]|[^\\.\[\]])*$")
 
 
 class UnknownTokenError(Exception):
@@ -45,6 +49,8 @@ class Dictionary:
     _split_relative_regex_cache = {}
     _sorted_relative_strings_cache = {}
     _match_relative_regex_cache = {}
+    _trie_cache = {}
+    _significant_chars = False
 
     def __init__(self, locale_info, settings=None):
         dictionary = {}
@@ -102,17 +108,46 @@ class Dictionary:
 
         :return: True if tokens are valid, False otherwise.
         """
-        has_only_keep_tokens = not set(tokens) - set(ALWAYS_KEEP_TOKENS)
+        has_only_keep_tokens = set(tokens).issubset(ALWAYS_KEEP_TOKENS)
         if has_only_keep_tokens:
             return False
-        match_relative_regex = self._get_match_relative_regex_cache()
-        for token in tokens:
-            if token.isdigit() or match_relative_regex.match(token) or token in self:
-                continue
-            else:
-                return False
-        else:
+        match_relative = self._get_match_relative_regex_cache().match
+        contains = self.__contains__
+        return all(token.isdigit() or match_relative(token) or contains(token) for token in tokens)
+
+    def may_have_valid_tokens(self, string):
+        """
+        Quickly check if a date string can possibly be split into valid tokens,
+        i.e. if it contains a digit or any character of a known word or relative
+        string. A True result does not mean the tokens are valid.
+
+        :param string:
+            Date string to be checked.
+        :type string: str
+
+        :return: False if the string cannot have valid tokens, True otherwise.
+        """
+        significant_chars = self._get_significant_chars()
+        if significant_chars is None or not significant_chars.isdisjoint(string):
             return True
+        return any(map(str.isdigit, string))
+
+    def _get_significant_chars(self):
+        if self._significant_chars is False:
+            self._significant_chars = self._construct_significant_chars()
+        return self._significant_chars
+
+    def _construct_significant_chars(self):
+        significant_chars = set('0123456789')
+        for relative_string in self._relative_strings:
+            if not SIMPLE_RELATIVE_STRING_PATTERN.match(CHARACTER_CLASS_PATTERN.sub('', relative_string)):
+                # may match characters it does not contain, e.g. with '.' or '\\w'
+                return None
+            significant_chars.update(relative_string, relative_string.lower(), relative_string.upper())
+        for word in self:
+            if word not in ALWAYS_KEEP_TOKENS:
+                significant_chars.update(word, word.lower())
+        return frozenset(significant_chars)
 
     def split(self, string, keep_formatting=False):
         """
@@ -129,6 +164,28 @@ class Dictionary:
 
         :return: A list of string tokens formed after splitting the date string.
         """
+        return self._split(string, keep_formatting, self._split_by_known_words)
+
+    def split_trie(self, string, keep_formatting=False):
+        """
+        Split the date string using translations in locale info, looking known words
+        up in a character trie instead of the known words regex. Produces the same
+        tokens as :meth:`split`.
+
+        :param string:
+            Date string to be splitted.
+        :type string:
+            str
+
+        :param keep_formatting:
+            If True, retain formatting of the date string.
+        :type keep_formatting: bool
+
+        :return: A list of string tokens formed after splitting the date string.
+        """
+        return self._split(string, keep_formatting, self._split_by_known_words_trie)
+
+    def _split(self, string, keep_formatting, split_by_known_words):
         if not string:
             return string
 
@@ -141,7 +198,7 @@ class Dictionary:
             if match_relative_regex.match(token):
                 tokens[i] = [token]
                 continue
-            tokens[i] = self._split_by_known_words(token, keep_formatting)
+            tokens[i] = split_by_known_words(token, keep_formatting)
 
         return list(filter(bool, chain.from_iterable(tokens)))
 
@@ -164,6 +221,57 @@ class Dictionary:
 
         return splitted
 
+    def _split_by_known_words_trie(self, string, keep_formatting):
+        if not string:
+            return string
+        if '\n' in string:
+            # '.' and '$' of the known words regex treat newlines specially
+            return self._split_by_known_words(string, keep_formatting)
+
+        offset = string.start if isinstance(string, StrWithBounds) else 0
+        trie = self._get_trie_cache()
+        length = len(string)
+        splitted = []
+        unparsed_start = start = 0
+        while start < length:
+            if (
+                self._no_word_spacing
+                or start == unparsed_start
+                or WORD_BOUNDARY_CHAR_PATTERN.match(string[start - 1])
+            ):
+                end = self._match_longest_known_word(trie, string, start)
+                if end is not None:
+                    unparsed = StrWithBounds(string[unparsed_start:start],
+                                             offset + unparsed_start, offset + start)
+                    known = StrWithBounds(string[start:end], offset + start, offset + end)
+                    if unparsed and self._should_capture(unparsed, keep_formatting):
+                        splitted.extend(self._split_by_numerals(unparsed, keep_formatting))
+                    if self._should_capture(known, keep_formatting):
+                        splitted.append(known)
+                    unparsed_start = start = end
+                    continue
+            start += 1
+
+        unknown = StrWithBounds(string[unparsed_start:], offset + unparsed_start, offset + length)
+        if unknown and self._should_capture(unknown, keep_formatting):
+            splitted.extend(self._split_by_numerals(unknown, keep_formatting))
+        return splitted
+
+    def _match_longest_known_word(self, trie, string, start):
+        node = trie
+        end = None
+        for i in range(start, len(string)):
+            node = node.get(string[i].lower())
+            if node is None:
+                break
+            if TRIE_WORD_END in node and (
+                self._no_word_spacing
+                or i + 1 == len(string)
+                or WORD_BOUNDARY_CHAR_PATTERN.match(string[i + 1])
+            ):
+                end = i + 1
+        return end
+
     def _split_by_numerals(self, string, keep_formatting):
         return [token for token in re_split_with_bounds(NUMERAL_PATTERN, string)
                 if self._should_capture(token, keep_formatting)]
@@ -199,6 +307,25 @@ class Dictionary:
             self._settings.registry_key, {})[self.info['name']] = \
             re.compile(regex, re.UNICODE | re.IGNORECASE)
 
+    def _get_trie_cache(self):
+        if (
+            self._settings.registry_key not in self._trie_cache
+            or self.info['name'] not in self._trie_cache[self._settings.registry_key]
+        ):
+            self._construct_trie()
+        return self._trie_cache[self._settings.registry_key][self.info['name']]
+
+    def _construct_trie(self):
+        trie = {}
+        for word in self:
+            if not word:
+                continue
+            node = trie
+            for char in word:
+                node = node.setdefault(char.lower(), {})
+            node[TRIE_WORD_END] = True
+        self._trie_cache.setdefault(self._settings.registry_key, {})[self.info['name']] = trie
+
     def _get_sorted_relative_strings_from_cache(self):
         if (
             self._settings.registry_key not in self._sorted_relative_strings_cache
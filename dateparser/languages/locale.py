@@ -1,3 +1,5 @@
+from copy import copy
+from functools import lru_cache
 from itertools import chain
 
 import regex as re
@@ -6,13 +8,38 @@ from collections import OrderedDict
 from dateutil import parser
 
 from dateparser.timezone_parser import pop_tz_offset_from_string, word_is_tz
-from dateparser.utils import normalize_unicode, combine_dicts, StrWithBounds, re_split_with_bounds, re_sub_with_bounds, join_with_bounds, strip_with_bounds
+from dateparser.utils import normalize_unicode, combine_dicts, StrWithBounds, re_split_with_bounds, split_with_bounds, re_sub_with_bounds, join_with_bounds, strip_with_bounds
 
 from .dictionary import Dictionary, NormalizedDictionary, ALWAYS_KEEP_TOKENS
 
 import warnings
 
 NUMERAL_PATTERN = re.compile(r'(\d+)', re.U)
+DIGITS_PATTERN = re.compile(r'\d+')
+MULTIPLE_SPACES_PATTERN = re.compile(r'\s{2,}')
+NO_WORD_SPACING_DIGITS_PATTERN = re.compile(r'[\d\.:\-/]+')
+NON_WORD_PATTERN = re.compile(r'^\W+$', re.U)
+NON_LETTERS_PATTERN = re.compile(r'^[\W\d_]+$', re.U)
+GROUP_NAME_REFERENCE_PATTERN = re.compile(r'(\\g<[^>]*>)')
+DIGITS = frozenset('0123456789')
+DELETE_DIGITS_TABLE = str.maketrans('', '', '0123456789')
+FRESHNESS_WORDS = frozenset(['day', 'week', 'month', 'year', 'hour', 'minute', 'second'])
+DASHES = frozenset(['-', '——', '—', '～'])
+WORD_JOINT_UNSUPPORTED_LANGUAGES = frozenset(["zh", "ja"])
+PUNCTUATION_TO_STRIP = '()\"\'{}[],.،'
+
+SENTENCE_SPLITTERS = {1: r'[\.!?;…\r\n]+(?:\s|$)*',  # most European, Tagalog, Hebrew, Georgian,
+                      # Indonesian, Vietnamese
+                      2: r'[\.!?;…\r\n]+(\s*[¡¿]*|$)|[¡¿]+',  # Spanish
+                      3: r'[|!?;\r\n]+(?:\s|$)+',  # Hindi and Bangla
+                      4: r'[。…‥\.!?？！;\r\n]+(?:\s|$)+',  # Japanese and Chinese
+                      5: r'[\r\n]+',  # Thai
+                      6: r'[\r\n؟!\.…]+(?:\s|$)+'}  # Arabic and Farsi
+
+
+@lru_cache(maxsize=4096)
+def _compile_simplification(pattern):
+    return re.compile(pattern, flags=re.I | re.U)
 
 
 class Locale:
@@ -32,8 +59,11 @@ class Locale:
 
     _dictionary = None
     _normalized_dictionary = None
+    _settings_dictionaries = None
     _simplifications = None
     _normalized_simplifications = None
+    _fused_simplifications = None
+    _normalized_fused_simplifications = None
     _splitters = None
     _wordchars = None
     _relative_translations = None
@@ -41,6 +71,9 @@ class Locale:
     _abbreviations = None
     _split_dictionary = None
     _wordchars_for_detection = None
+    _sentence_splitter = None
+    _split_with_trie = True
+    _parserinfo_cache = None
 
     def __init__(self, shortname, language_info):
         self.shortname = shortname
@@ -69,7 +102,13 @@ class Locale:
         if settings.NORMALIZE:
             date_string = normalize_unicode(date_string)
         date_string = self._simplify(date_string, settings=settings)
+        without_digits = date_string.translate(DELETE_DIGITS_TABLE)
+        if len(without_digits) < len(date_string) and not without_digits.strip(' '):
+            # digits and spaces only, every token would be valid
+            return True
         dictionary = self._get_dictionary(settings)
+        if not dictionary.may_have_valid_tokens(date_string):
+            return False
         date_tokens = dictionary.split(date_string)
         return dictionary.are_tokens_valid(date_tokens)
 
@@ -128,6 +167,8 @@ class Locale:
         date_string = self._simplify(date_string, settings=settings)
         dictionary = self._get_dictionary(settings)
         date_string_tokens = dictionary.split(date_string, keep_formatting)
+        contains = dictionary.__contains__
+        get_with_bounds = dictionary.get_with_bounds
 
         relative_translations = self._get_relative_translations(settings=settings)
 
@@ -138,12 +179,12 @@ class Locale:
                     date_string_tokens[i] = pattern.sub(replacement, word)
                     break
             else:
-                if word in dictionary:
+                if contains(word):
                     if keep_formatting and not word.isalpha():
                         fallback = word  
                     else:
                         fallback = StrWithBounds('', word.start, word.end)
-                    date_string_tokens[i] = dictionary.get_with_bounds(word) or fallback
+                    date_string_tokens[i] = get_with_bounds(word) or fallback
         if "in" in date_string_tokens:
             date_string_tokens = self._clear_future_words(date_string_tokens)
 
@@ -181,10 +222,11 @@ class Locale:
         return relative_dictionary
 
     def translate_search(self, search_string, settings=None):
-        dashes = ['-', '——', '—', '～']
-        word_joint_unsupported_languages = ["zh", "ja"]
         sentences = self._sentence_split(search_string, settings=settings)
         dictionary = self._get_dictionary(settings=settings)
+        contains = dictionary.__contains__
+        get_with_bounds = dictionary.get_with_bounds
+        joins_words = self.shortname not in WORD_JOINT_UNSUPPORTED_LANGUAGES
         translated = []
         original = []
         for sentence in sentences:
@@ -194,8 +236,6 @@ class Locale:
             last_token_index = len(simplified_tokens) - 1
             skip_next_token = False
             for i, word in enumerate(simplified_tokens):
-                next_word = simplified_tokens[i + 1] if i < last_token_index else StrWithBounds("", word.start, word.end)
-                current_and_next_joined = self._join_chunk([word, next_word], settings=settings)
                 if skip_next_token:
                     skip_next_token = False
                     continue
@@ -203,25 +243,31 @@ class Locale:
                 if word == '' or word == ' ':
                     translated_chunk.append(word)
                     original_chunk.append(original_tokens[i])
-                elif (
-                    current_and_next_joined in dictionary
-                    and word not in dashes
-                    and self.shortname not in word_joint_unsupported_languages
-                ):
-                    translated_chunk.append(dictionary.get_with_bounds(current_and_next_joined))
-                    original_chunk.append(
-                        self._join_chunk([original_tokens[i], original_tokens[i + 1]], settings=settings)
-                    )
-                    skip_next_token = True
-                elif word in dictionary and word not in dashes:
-                    translated_chunk.append(dictionary.get_with_bounds(word))
+                    continue
+
+                is_dash = word in DASHES
+                if joins_words and not is_dash:
+                    next_word = simplified_tokens[i + 1] if i < last_token_index else StrWithBounds("", word.start, word.end)
+                    current_and_next_joined = self._join_chunk([word, next_word], settings=settings)
+                    if contains(current_and_next_joined):
+                        translated_chunk.append(get_with_bounds(current_and_next_joined))
+                        original_chunk.append(
+                            self._join_chunk([original_tokens[i], original_tokens[i + 1]], settings=settings)
+                        )
+                        skip_next_token = True
+                        continue
+
+                stripped_word = strip_with_bounds(word, PUNCTUATION_TO_STRIP)
+                if contains(word) and not is_dash:
+                    translated_chunk.append(get_with_bounds(word))
                     original_chunk.append(original_tokens[i])
-                elif strip_with_bounds(word, '()\"\'{}[],.،') in dictionary and word not in dashes:
-                    punct = word[len(strip_with_bounds(word, '()\"\'{}[],.،')):]
-                    if punct and dictionary.get_with_bounds(strip_with_bounds(word, '()\"\'{}[],.،')):
-                        translated_chunk.append(dictionary.get_with_bounds(strip_with_bounds(word, '()\"\'{}[],.،')) + punct)
+                elif contains(stripped_word) and not is_dash:
+                    punct = word[len(stripped_word):]
+                    translation = get_with_bounds(stripped_word)
+                    if punct and translation:
+                        translated_chunk.append(translation + punct)
                     else:
-                        translated_chunk.append(dictionary.get_with_bounds(strip_with_bounds(word, '()\"\'{}[],.،')))
+                        translated_chunk.append(translation)
                     original_chunk.append(original_tokens[i])
                 elif self._token_with_digits_is_ok(word):
                     translated_chunk.append(word)
@@ -257,33 +303,26 @@ class Locale:
         return self._abbreviations
 
     def _sentence_split(self, string, settings):
-        abbreviations = self._get_abbreviations(settings=settings)
-        digit_abbreviations = ['[0-9]']  # numeric date with full stop
-        abbreviation_string = ''
-
-        for abbreviation in abbreviations:
-            abbreviation_string += '(?<! ' + abbreviation[:-1] + ')'  # negative lookbehind
-        if self.shortname in ['fi', 'cs', 'hu', 'de', 'da']:
-            for digit_abbreviation in digit_abbreviations:
-                abbreviation_string += '(?<!' + digit_abbreviation + ')'  # negative lookbehind
-
-        splitters_dict = {1: r'[\.!?;…\r\n]+(?:\s|$)*',  # most European, Tagalog, Hebrew, Georgian,
-                          # Indonesian, Vietnamese
-                          2: r'[\.!?;…\r\n]+(\s*[¡¿]*|$)|[¡¿]+',  # Spanish
-                          3: r'[|!?;\r\n]+(?:\s|$)+',  # Hindi and Bangla
-                          4: r'[。…‥\.!?？！;\r\n]+(?:\s|$)+',  # Japanese and Chinese
-                          5: r'[\r\n]+',  # Thai
-                          6: r'[\r\n؟!\.…]+(?:\s|$)+'}  # Arabic and Farsi
-        if 'sentence_splitter_group' not in self.info:
-            split_reg = abbreviation_string + splitters_dict[1]
-            sentences = re_split_with_bounds(split_reg, string)
-        else:
-            split_reg = abbreviation_string + splitters_dict[self.info['sentence_splitter_group']]
-            sentences = re_split_with_bounds(split_reg, string)
-
+        sentences = re_split_with_bounds(self._get_sentence_splitter(settings), string)
         sentences = filter(None, sentences)
         return sentences
 
+    def _get_sentence_splitter(self, settings):
+        if self._sentence_splitter is None:
+            abbreviations = self._get_abbreviations(settings=settings)
+            digit_abbreviations = ['[0-9]']  # numeric date with full stop
+            abbreviation_string = ''
+
+            for abbreviation in abbreviations:
+                abbreviation_string += '(?<! ' + abbreviation[:-1] + ')'  # negative lookbehind
+            if self.shortname in ['fi', 'cs', 'hu', 'de', 'da']:
+                for digit_abbreviation in digit_abbreviations:
+                    abbreviation_string += '(?<!' + digit_abbreviation + ')'  # negative lookbehind
+
+            splitter = SENTENCE_SPLITTERS[self.info.get('sentence_splitter_group', 1)]
+            self._sentence_splitter = re.compile(abbreviation_string + splitter)
+        return self._sentence_splitter
+
     def _simplify_split_align(self, original, settings):
         # TODO: Switch to new split method.
         original_tokens = self._word_split(original, settings=settings)
@@ -350,7 +389,7 @@ class Locale:
         newdict = {}
         for item in dictionary:
             if ' ' in item:
-                items = re_split_with_bounds(" ",item)
+                items = split_with_bounds(item, " ")
                 for i in items:
                     newdict[i] = dictionary[item]
             else:
@@ -361,99 +400,106 @@ class Locale:
         if 'no_word_spacing' in self.info:
             return self._split(string, keep_formatting=True, settings=settings)
         else:
-            return re_split_with_bounds(" ",string)
+            return split_with_bounds(string, " ")
 
     def _split(self, date_string, keep_formatting, settings=None):
-        tokens = [date_string]
-        tokens = list(self._split_tokens_with_regex(tokens, r"(\d+)"))
-        tokens = list(
-            self._split_tokens_by_known_words(tokens, keep_formatting, settings=settings))
-        return tokens
+        return list(self._tokenize(date_string, keep_formatting, settings=settings))
+
+    def _tokenize(self, date_string, keep_formatting, settings=None):
+        dictionary = self._get_dictionary(settings)
+        split = dictionary.split_trie if self._split_with_trie else dictionary.split
+        for token in re_split_with_bounds(NUMERAL_PATTERN, date_string):
+            if token:
+                yield from split(token, keep_formatting)
 
     def _split_tokens_with_regex(self, tokens, regex):
-        tokens = tokens[:]
-        for i, token in enumerate(tokens):
-            tokens[i] = re_split_with_bounds(regex, token)
-        return filter(bool, chain.from_iterable(tokens))
+        for token in tokens:
+            for part in re_split_with_bounds(regex, token):
+                if part:
+                    yield part
 
     def _split_tokens_by_known_words(self, tokens, keep_formatting, settings=None):
         dictionary = self._get_dictionary(settings)
-        for i, token in enumerate(tokens):
-            tokens[i] = dictionary.split(token, keep_formatting)
-        return list(chain.from_iterable(tokens))
+        split = dictionary.split_trie if self._split_with_trie else dictionary.split
+        return list(chain.from_iterable(split(token, keep_formatting) for token in tokens))
 
     def _join_chunk(self, chunk, settings):
         if 'no_word_spacing' in self.info:
             return self._join(chunk, separator="", settings=settings)
         else:
-            return re_sub_with_bounds(r'\s{2,}', ' ', join_with_bounds(" ", chunk, "_join_chunk"))
+            return re_sub_with_bounds(MULTIPLE_SPACES_PATTERN, ' ', join_with_bounds(" ", chunk, "_join_chunk"))
 
     def _token_with_digits_is_ok(self, token):
         if 'no_word_spacing' in self.info:
-            if re.search(r'[\d\.:\-/]+', token) is not None:
-                return True
-            else:
-                return False
-
+            return NO_WORD_SPACING_DIGITS_PATTERN.search(token) is not None
         else:
-            if re.search(r'\d+', token) is not None:
-                return True
-            else:
-                return False
+            return DIGITS_PATTERN.search(token) is not None
 
     def _simplify(self, date_string, settings=None):
         date_string = date_string.lower()
+        fused_simplifications = self._get_fused_simplifications(settings=settings)
+        if fused_simplifications is None or not fused_simplifications.search(date_string):
+            return date_string
         simplifications = self._get_simplifications(settings=settings)
-        for simplification in simplifications:
-            pattern, replacement = list(simplification.items())[0]
-            date_string = pattern.sub(replacement, date_string).lower()
+        for pattern, replacement in simplifications:
+            date_string = pattern.sub(replacement, date_string)
         return date_string
 
+    def _get_fused_simplifications(self, settings=None):
+        # Simplifications must be applied in order, as some of them only match
+        # the output of earlier ones. If none of them matches the original
+        # string, though, none can match at all, so a single alternation of
+        # all the patterns lets most strings skip the sequential pass.
+        if settings.NORMALIZE:
+            if self._normalized_fused_simplifications is None:
+                self._normalized_fused_simplifications = self._generate_fused_simplifications(settings)
+            return self._normalized_fused_simplifications or None
+        else:
+            if self._fused_simplifications is None:
+                self._fused_simplifications = self._generate_fused_simplifications(settings)
+            return self._fused_simplifications or None
+
+    def _generate_fused_simplifications(self, settings):
+        simplifications = self._get_simplifications(settings=settings)
+        if not simplifications:
+            return False
+        return re.compile('|'.join('(?:%s)' % pattern.pattern for pattern, _ in simplifications),
+                          flags=re.I | re.U)
+
     def _get_simplifications(self, settings=None):
-        no_word_spacing = eval(self.info.get('no_word_spacing', 'False'))
         if settings.NORMALIZE:
             if self._normalized_simplifications is None:
-                self._normalized_simplifications = []
-                simplifications = self._generate_simplifications(normalize=True)
-                for simplification in simplifications:
-                    pattern, replacement = list(simplification.items())[0]
-                    if not no_word_spacing:
-                        pattern = r'(?<=\A|\W|_)%s(?=\Z|\W|_)' % pattern
-                    pattern = re.compile(pattern, flags=re.I | re.U)
-                    self._normalized_simplifications.append({pattern: replacement})
+                self._normalized_simplifications = self._generate_simplifications(normalize=True)
             return self._normalized_simplifications
-
         else:
             if self._simplifications is None:
-                self._simplifications = []
-                simplifications = self._generate_simplifications(normalize=False)
-                for simplification in simplifications:
-                    pattern, replacement = list(simplification.items())[0]
-                    if not no_word_spacing:
-                        pattern = r'(?<=\A|\W|_)%s(?=\Z|\W|_)' % pattern
-                    pattern = re.compile(pattern, flags=re.I | re.U)
-                    self._simplifications.append({pattern: replacement})
+                self._simplifications = self._generate_simplifications(normalize=False)
             return self._simplifications
 
     def _generate_simplifications(self, normalize=False):
+        no_word_spacing = eval(self.info.get('no_word_spacing', 'False'))
         simplifications = []
         for simplification in self.info.get('simplifications', []):
-            c_simplification = {}
-            key, value = list(simplification.items())[0]
+            key, value = next(iter(simplification.items()))
             if normalize:
                 key = normalize_unicode(key)
 
             if isinstance(value, int):
-                c_simplification[key] = str(value)
-            else:
-                c_simplification[key] = normalize_unicode(value) if normalize else value
-
-            simplifications.append(c_simplification)
+                value = str(value)
+            elif normalize:
+                value = normalize_unicode(value)
+            # Group references only copy the lowercased date string, so lowercasing the
+            # rest of the replacement keeps the simplified string lowercase
+            value = ''.join(part if i % 2 else part.lower()
+                            for i, part in enumerate(GROUP_NAME_REFERENCE_PATTERN.split(value)))
+
+            if not no_word_spacing:
+                key = r'(?<=\A|\W|_)%s(?=\Z|\W|_)' % key
+            simplifications.append((_compile_simplification(key), value))
         return simplifications
 
     def _clear_future_words(self, words):
-        freshness_words = {'day', 'week', 'month', 'year', 'hour', 'minute', 'second'}
-        if set(words).isdisjoint(freshness_words):
+        if FRESHNESS_WORDS.isdisjoint(words):
             words.remove("in")
         return words
 
@@ -461,13 +507,14 @@ class Locale:
         if not tokens:
             return ""
 
-        capturing_splitters = self._get_splitters(settings)['capturing']
-        joined = tokens[0]
+        is_capturing = self._get_splitters(settings)['capturing'].__contains__
+        parts = [tokens[0]]
         for i in range(1, len(tokens)):
             left, right = tokens[i - 1], tokens[i]
-            if left not in capturing_splitters and right not in capturing_splitters:
-                joined += separator
-            joined += right
+            if not is_capturing(left) and not is_capturing(right):
+                parts.append(separator)
+            parts.append(right)
+        joined = ''.join(parts)
 
         if isinstance(tokens[0], StrWithBounds):
             start = tokens[0].start
@@ -484,16 +531,23 @@ class Locale:
             return joined
 
     def _get_dictionary(self, settings=None):
-        if not settings.NORMALIZE:
-            if self._dictionary is None:
-                self._generate_dictionary()
-            self._dictionary._settings = settings
-            return self._dictionary
-        else:
-            if self._normalized_dictionary is None:
-                self._generate_normalized_dictionary()
-            self._normalized_dictionary._settings = settings
-            return self._normalized_dictionary
+        if self._settings_dictionaries is None:
+            self._settings_dictionaries = {}
+        key = (settings.NORMALIZE, settings.registry_key)
+        dictionary = self._settings_dictionaries.get(key)
+        if dictionary is None:
+            # Shallow copies share the translations, only the settings differ
+            if not settings.NORMALIZE:
+                if self._dictionary is None:
+                    self._generate_dictionary()
+                dictionary = copy(self._dictionary)
+            else:
+                if self._normalized_dictionary is None:
+                    self._generate_normalized_dictionary()
+                dictionary = copy(self._normalized_dictionary)
+            dictionary._settings = settings
+            self._settings_dictionaries[key] = dictionary
+        return dictionary
 
     def _get_wordchars(self, settings=None):
         if self._wordchars is None:
@@ -517,35 +571,28 @@ class Locale:
         wordchars = self._get_wordchars(settings)
         skip = set(self.info.get('skip', [])) | splitters['capturing']
         for token in skip:
-            if not re.match(r'^\W+$', token, re.UNICODE):
-                continue
-            if token in wordchars:
+            if token in wordchars and NON_WORD_PATTERN.match(token):
                 splitters['wordchars'].add(token)
 
         self._splitters = splitters
 
     def _set_wordchars(self, settings=None):
-        wordchars = set()
-        for word in self._get_dictionary(settings):
-            if re.match(r'^[\W\d_]+$', word, re.UNICODE):
-                continue
-            for char in word:
-                wordchars.add(char.lower())
-
-        self._wordchars = wordchars - {" "} | {"0", "1", "2", "3", "4", "5", "6", "7", "8", "9"}
+        wordchars = self._collect_wordchars(settings)
+        wordchars.discard(" ")
+        self._wordchars = wordchars | DIGITS
 
     def get_wordchars_for_detection(self, settings):
         if self._wordchars_for_detection is None:
-            wordchars = set()
-            for word in self._get_dictionary(settings):
-                if re.match(r'^[\W\d_]+$', word, re.UNICODE):
-                    continue
-                for char in word:
-                    wordchars.add(char.lower())
-            self._wordchars_for_detection = wordchars - {"0", "1", "2", "3", "4", "5", "6", "7", "8", "9",
-                                                         ":", "(", ")", "'", "q", "a", "m", "p", " "}
+            self._wordchars_for_detection = self._collect_wordchars(settings) - {
+                "0", "1", "2", "3", "4", "5", "6", "7", "8", "9",
+                ":", "(", ")", "'", "q", "a", "m", "p", " "}
         return self._wordchars_for_detection
 
+    def _collect_wordchars(self, settings):
+        is_not_a_word = NON_LETTERS_PATTERN.match
+        return {char.lower() for word in self._get_dictionary(settings)
+                if not is_not_a_word(word) for char in word}
+
     def _generate_dictionary(self, settings=None):
         self._dictionary = Dictionary(self.info, settings=settings)
 
@@ -553,17 +600,24 @@ class Locale:
         self._normalized_dictionary = NormalizedDictionary(self.info, settings=settings)
 
     def to_parserinfo(self, base_cls=parser.parserinfo):
+        if self._parserinfo_cache is None:
+            self._parserinfo_cache = {}
+        if base_cls not in self._parserinfo_cache:
+            self._parserinfo_cache[base_cls] = self._generate_parserinfo(base_cls)
+        return self._parserinfo_cache[base_cls]
+
+    def _generate_parserinfo(self, base_cls):
         attributes = {
             'JUMP': self.info.get('skip', []),
             'PERTAIN': self.info.get('pertain', []),
-            'WEEKDAYS': [self.info['monday'],
+            'WEEKDAYS': (self.info['monday'],
                          self.info['tuesday'],
                          self.info['wednesday'],
                          self.info['thursday'],
                          self.info['friday'],
                          self.info['saturday'],
-                         self.info['sunday']],
-            'MONTHS': [self.info['january'],
+                         self.info['sunday']),
+            'MONTHS': (self.info['january'],
                        self.info['february'],
                        self.info['march'],
                        self.info['april'],
@@ -574,10 +628,10 @@ class Locale:
                        self.info['september'],
                        self.info['october'],
                        self.info['november'],
-                       self.info['december']],
-            'HMS': [self.info['hour'],
+                       self.info['december']),
+            'HMS': (self.info['hour'],
                     self.info['minute'],
-                    self.info['second']],
+                    self.info['second']),
         }
         name = '{language}ParserInfo'.format(language=self.info['name'])
-        return type(name, bases=[base_cls], dict=attributes)
+        return type(name, (base_cls,), attributes)
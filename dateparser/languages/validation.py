@@ -293,7 +293,7 @@ class LanguageValidator:
                     result = False
                     continue
 
-                key, value = list(simplification.items())[0]
+                key, value = next(iter(simplification.items()))
                 if not isinstance(key, str) or not isinstance(value, (str, int)):
                     cls.get_logger().error(
                         "Invalid simplification %(simplification)r for '%(id)s' language: "
@@ -304,7 +304,6 @@ def re_match_with_bounds(regex, string):
 
 
 def re_split_with_bounds(regex, string):
-    raw_string = string
     if type(string) is StrWithBounds:
         cur_start = string.start
         cur_end = string.end
@@ -314,13 +313,14 @@ def re_split_with_bounds(regex, string):
         string = StrWithBounds(string, cur_start, cur_end)
     
     result = []
-    for i in range(1000): #would be "while True:", but I want to catch infinite loops
+    while True:
         next_match = re.search(regex, string)
         if next_match is None or len(string)==0:
             result.append(string)
             return result
         m_start, m_end = next_match.start(), next_match.end()
         if m_end == 0:
+            # always consume at least one character, so the loop terminates
             m_start = m_end = 1
         result.append(
             StrWithBounds(string[:m_start],
@@ -338,42 +338,28 @@ def re_split_with_bounds(regex, string):
             cur_start,
             cur_end
         )
-    raise Exception(f"Infinite loop? {result} <|{regex}|> <<{raw_string}>>")
 
 
 def split_with_bounds(string, splitter):
     slen = len(splitter)
     assert slen > 0
 
-    raw_string = string
     if type(string) is StrWithBounds:
-        cur_start = string.start
-        cur_end = string.end
+        offset = string.start
+        end = string.end
     else:
-        cur_start = 0
-        cur_end = len(string)
-        string = StrWithBounds(string, cur_start, cur_end)
-    
+        offset = 0
+        end = len(string)
+
     result = []
-    for i in range(1000): #would be "while True:", but I want to catch infinite loops
-        next_match = string.find(splitter)
-        if next_match is -1 or len(string)==0:
-            result.append(string)
-            return result
-        m_start, m_end = next_match, next_match + slen
-        result.append(
-            StrWithBounds(string[:m_start],
-                cur_start,
-                cur_start + m_start
-            )
-        )
-        cur_start += m_end
-        string = StrWithBounds(
-            string[m_end:],
-            cur_start,
-            cur_end
-        )
-    raise Exception(f"Infinite loop? {result} <|{splitter}|> <<{raw_string}>>")
+    pos = 0
+    next_match = string.find(splitter)
+    while next_match != -1:
+        result.append(StrWithBounds(string[pos:next_match], offset + pos, offset + next_match))
+        pos = next_match + slen
+        next_match = string.find(splitter, pos)
+    result.append(StrWithBounds(string[pos:], offset + pos, end))
+    return result
 
 def join_with_bounds(sep, strings, where_from = "?"):
     if len(strings) == 0:
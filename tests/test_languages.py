@@ -9,13 +9,15 @@ from dateparser.languages import default_loader, Locale
 from dateparser.languages.validation import LanguageValidator
 from dateparser.conf import apply_settings, settings
 from dateparser.search.detection import AutoDetectLanguage, ExactLanguages
-from dateparser.utils import normalize_unicode
+from dateparser.utils import normalize_unicode, StrWithBounds
 from dateparser import parse
 from dateparser.date import DateDataParser
 from dateparser.search import search_dates
 
 from datetime import datetime
 
+from dateutil import parser
+
 from tests import BaseTestCase
 
 
@@ -34,6 +36,13 @@ class TestLocaleTranslation:
         print(result)
         assert expected == result
 
+    def test_to_parserinfo_is_cached(self):
+        locale = default_loader.get_locale('en')
+        parserinfo = locale.to_parserinfo()
+        assert issubclass(parserinfo, parser.parserinfo)
+        assert parserinfo.MONTHS[0] == locale.info['january']
+        assert locale.to_parserinfo() is parserinfo
+
 
 class TestBundledLanguages(BaseTestCase):
     def setUp(self):
@@ -1872,6 +1881,25 @@ class TestBundledLanguages(BaseTestCase):
         self.when_datetime_string_splitted()
         self.then_tokens_are(expected_tokens)
 
+    @parameterized.expand([
+        param('en', "17th October, 2034 @ 01:08 am PDT", keep_formatting=False),
+        param('en', "25_April_2008", keep_formatting=True),
+        param('ru', "8 января 2015 г. в 9:10", keep_formatting=False),
+        param('mgo', "aneg 5 12 iməg àdùmbə̀ŋ 2001 09:14 pm", keep_formatting=False),
+        param('he', "ה-21 לאוקטובר 2016 ב-15:00", keep_formatting=True),
+        param('ja', "2018年3月12日 午後9時", keep_formatting=False),
+        param('zh', "2016年7月2日 下午3点", keep_formatting=True),
+    ])
+    def test_split_trie_matches_split(self, shortname, datetime_string, keep_formatting):
+        self.given_settings(settings={'NORMALIZE': False})
+        self.given_bundled_language(shortname)
+        self.given_string(StrWithBounds(datetime_string, 0, len(datetime_string)))
+        dictionary = self.language._get_dictionary(self.settings)
+        expected = dictionary.split(self.datetime_string, keep_formatting)
+        tokens = dictionary.split_trie(self.datetime_string, keep_formatting)
+        self.assertEqual(expected, tokens)
+        self.assertEqual([(t.start, t.end) for t in expected], [(t.start, t.end) for t in tokens])
+
     @parameterized.expand([
         param('en', "17th October, 2034 @ 01:08 am PDT", strip_timezone=True),
         param('en', "#@Sept#04#2014", strip_timezone=False),
@@ -1914,6 +1942,20 @@ class TestBundledLanguages(BaseTestCase):
         self.when_datetime_string_checked_if_applicable(strip_timezone)
         self.then_language_is_not_applicable()
 
+    @parameterized.expand([
+        param('en', "неделя", expected=False),
+        param('en', "ساعتين", expected=False),
+        param('en', "", expected=False),
+        param('en', "неделя 5", expected=True),
+        param('en', "May", expected=True),
+        param('ru', "3 недели", expected=True),
+    ])
+    def test_may_have_valid_tokens(self, shortname, datetime_string, expected):
+        self.given_settings()
+        self.given_bundled_language(shortname)
+        dictionary = self.language._get_dictionary(self.settings)
+        self.assertEqual(expected, dictionary.may_have_valid_tokens(datetime_string))
+
     @apply_settings
     def given_settings(self, settings=None):
         self.settings = settings
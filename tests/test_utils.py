@@ -9,7 +9,8 @@ from parameterized import parameterized, param
 from dateparser.utils import (
     find_date_separator, localize_timezone, apply_timezone,
     apply_timezone_from_settings, registry,
-    get_last_day_of_month, get_previous_leap_year, get_next_leap_year)
+    get_last_day_of_month, get_previous_leap_year, get_next_leap_year,
+    split_with_bounds, re_split_with_bounds, StrWithBounds)
 from pytz import UnknownTimeZoneError, utc
 from dateparser.conf import settings
 
@@ -153,3 +154,21 @@ def test_get_previous_leap_year(year, expected_previous_leap_year):
     ])
 def test_get_next_leap_year(year, expected_next_leap_year):
     assert get_next_leap_year(year) == expected_next_leap_year
+
+
+@pytest.mark.parametrize(
+    "string,expected", [
+        (StrWithBounds("10 May 2015", 3, 14), [("10", 3, 5), ("May", 6, 9), ("2015", 10, 14)]),
+        (StrWithBounds(" a  b ", 0, 6), [("", 0, 0), ("a", 1, 2), ("", 3, 3), ("b", 4, 5), ("", 6, 6)]),
+        (StrWithBounds("", 2, 2), [("", 2, 2)]),
+        (StrWithBounds(" ".join(["word"] * 1500), 0, 7499), [("word", 5 * i, 5 * i + 4) for i in range(1500)]),
+    ])
+def test_split_with_bounds(string, expected):
+    assert [(token, token.start, token.end) for token in split_with_bounds(string, " ")] == expected
+
+
+def test_re_split_with_bounds_many_pieces():
+    string = StrWithBounds(". ".join(["word"] * 1500), 0, 8998)
+    tokens = re_split_with_bounds(r'\.\s', string)
+    assert [(token, token.start, token.end) for token in tokens] == [
+        ("word", 6 * i, 6 * i + 4) for i in range(1500)]